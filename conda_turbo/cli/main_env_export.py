@@ -4,6 +4,7 @@
 
 Dumps specified environment package specifications to the screen.
 """
+import sys
 from argparse import Namespace, ArgumentParser
 
 
@@ -11,7 +12,6 @@ from argparse import Namespace, ArgumentParser
 def execute(args: Namespace, parser: ArgumentParser) -> int:
     from conda.base.context import context, determine_target_prefix, env_name
     from ..env.env import from_environment
-    from conda.cli.common import stdout_json
     prefix = determine_target_prefix(context, args)
     env = from_environment(
         env_name(prefix),
@@ -28,11 +28,15 @@ def execute(args: Namespace, parser: ArgumentParser) -> int:
     if args.channel is not None:
         env.add_channels(args.channel)
 
-    if args.file is None:
-        stdout_json(env.to_dict()) if args.json else print(env.to_yaml(), end="")
+    if args.file is None and args.json:
+        env.to_json(sys.stdout)
+    elif args.file is None:
+        env.to_yaml(stream=sys.stdout)
+    elif args.json:
+        with open(args.file, "w") as fp:
+            env.to_dict(stream=fp)
     else:
-        fp = open(args.file, "wb")
-        env.to_dict(stream=fp) if args.json else env.to_yaml(stream=fp)
-        fp.close()
+        with open(args.file, "wb") as fp:
+            env.to_yaml(stream=fp)
 
     return 0
@@ -4,7 +4,9 @@
 import json
 import os
 import re
+from collections.abc import Sequence
 from itertools import chain
+from operator import itemgetter
 from os.path import abspath, expanduser, expandvars
 
 from conda.base.context import context
@@ -83,7 +85,7 @@ def from_environment(
     variables = pd.get_environment_env_vars()
 
     history = History(prefix).get_requested_specs_map()
-    requested = [str(package) for package in history.values()]
+    requested = _LazyRecords(tuple(history.values()), str)
 
     if from_history:
         history = History(prefix).get_requested_specs_map()
@@ -131,7 +133,7 @@ def from_environment(
             if canonical_name not in channels:
                 channels.insert(0, canonical_name)
 
-    explicit = [f"{prec.url}#{prec.md5}" for prec in precs]
+    explicit = _LazyRecords(precs, lambda prec: f"{prec.url}#{prec.md5}")
 
     return Environment(
         name=name,
@@ -219,6 +221,55 @@ class Dependencies(dict):
         self.parse()
 
 
+class _LazyRecords(Sequence):
+    """Read-only sequence formatting each record only when it is accessed
+
+    Compares equal to a ``list`` of the formatted records; use ``list()`` (or
+    ``Environment.to_dict``) where a real ``list`` is needed, e.g. for ``json``.
+    """
+
+    def __init__(self, records, fmt):
+        self.records = records
+        self.fmt = fmt
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.fmt(record) for record in self.records[index]]
+        return self.fmt(self.records[index])
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return (self.fmt(record) for record in self.records)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _LazyRecords)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + other
+
+    def __radd__(self, other):
+        return other + list(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _materialize(value):
+    """Return ``value`` as a ``list`` if it is a ``_LazyRecords``"""
+    return list(value) if isinstance(value, _LazyRecords) else value
+
+
+def _write_text(stream, text):
+    """Write ``text`` to ``stream``, encoding it for binary streams like ``ruamel`` does"""
+    stream.write(text if hasattr(stream, "encoding") else text.encode("utf-8"))
+
+
 class Environment:
     """A class representing an ``environmentPP.yaml`` file"""
 
@@ -257,33 +308,94 @@ class Environment:
         """Remove all channels from the ``Environment``"""
         self.channels = []
 
-    def to_dict(self, stream=None):
-        """Convert information related to the ``Environment`` into a dictionary"""
-        d = {"name": self.name}
+    def iter_sections(self):
+        """Yield the ``(key, value)`` pairs of the ``Environment`` in output order"""
+        yield "name", self.name
         if self.channels:
-            d["channels"] = self.channels
+            yield "channels", self.channels
         if self.dependencies:
-            d["dependencies"] = self.dependencies.raw
+            yield "dependencies", self.dependencies.raw
         if self.variables:
-            d["variables"] = self.variables
+            yield "variables", self.variables
         if self.prefix:
-            d["prefix"] = self.prefix
-        if self.subdir and not self.only_base_fields:
-            d["subdir"] = self.subdir
-        if self.requested and not self.only_base_fields:
-            d["requested"] = self.requested
-        if self.explicit and not self.only_base_fields:
-            d["explicit"] = self.explicit
+            yield "prefix", self.prefix
+        if self.only_base_fields:
+            return
+        if self.subdir:
+            yield "subdir", self.subdir
+        if self.requested:
+            yield "requested", self.requested
+        if self.explicit:
+            yield "explicit", self.explicit
+
+    def to_dict(self, stream=None):
+        """Convert information related to the ``Environment`` into a dictionary
+
+        When ``stream`` is given the dictionary is written to it as ``json``
+        one section (and list item) at a time, without building the full
+        document in memory.
+        """
         if stream is None:
-            return d
-        stream.write(json.dumps(d))
+            return {key: _materialize(value) for key, value in self.iter_sections()}
+        self._write_json(stream)
+
+    def to_json(self, stream):
+        """Write the ``Environment`` to ``stream`` as indented ``json`` with sorted keys
+
+        The output, including the trailing newline, matches what
+        ``stdout_json(self.to_dict())`` printed (``indent=2``, sorted keys), but
+        it is written one section (and list item) at a time straight to
+        ``stream`` rather than through conda's stdout logger/reporters.
+        """
+        self._write_json(stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+    def _write_json(self, stream, indent=None, sort_keys=False):
+        """Incrementally write the sections to ``stream`` in ``json.dumps`` format"""
+
+        def newline(level):
+            return "" if indent is None else "\n" + " " * (indent * level)
+
+        def dumps(value, level):
+            out = json.dumps(value, indent=indent, sort_keys=sort_keys)
+            return out if indent is None else out.replace("\n", newline(level))
+
+        separator = ", " if indent is None else ","
+        sections = self.iter_sections()
+        if sort_keys:
+            sections = sorted(sections, key=itemgetter(0))
+        stream.write("{")
+        for i, (key, value) in enumerate(sections):
+            stream.write((separator if i else "") + newline(1))
+            stream.write(f"{json.dumps(key)}: ")
+            if isinstance(value, (list, _LazyRecords)):
+                stream.write("[")
+                empty = True
+                for item in value:
+                    stream.write(("" if empty else separator) + newline(2))
+                    stream.write(dumps(item, 2))
+                    empty = False
+                stream.write("]" if empty else newline(1) + "]")
+            else:
+                stream.write(dumps(value, 1))
+        stream.write(newline(0) + "}")
 
     def to_yaml(self, stream=None):
-        """Convert information related to the ``Environment`` into a ``yaml`` string"""
-        d = self.to_dict()
-        out = yaml_safe_dump(d, stream)
+        """Convert information related to the ``Environment`` into a ``yaml`` string
+
+        When ``stream`` is given each top-level section is dumped separately,
+        and list sections one item at a time, so the full document is never
+        held in memory.
+        """
         if stream is None:
-            return out
+            return yaml_safe_dump(self.to_dict())
+        for key, value in self.iter_sections():
+            if isinstance(value, (list, _LazyRecords)):
+                _write_text(stream, f"{key}:\n")
+                for item in value:
+                    yaml_safe_dump([item], stream)
+            else:
+                yaml_safe_dump({key: value}, stream)
 
     @property
     def has_additional_fields(self) -> bool:
@@ -0,0 +1,144 @@
+# Copyright (C) 2012 Anaconda, Inc
+# SPDX-License-Identifier: BSD-3-Clause
+"""Check that streamed ``Environment`` output matches the single-dump output."""
+import json
+from io import BytesIO, StringIO
+
+import pytest
+
+pytest.importorskip("conda")
+
+from conda.common.serialize import yaml_safe_dump  # noqa: E402
+
+from conda_turbo.env.env import Environment, _LazyRecords  # noqa: E402
+
+EXPLICIT = [
+    ("https://conda.anaconda.org/conda-forge/noarch/pip-23.2-pyhd8ed1ab_0.conda", "2c7a"),
+    ("https://conda.anaconda.org/conda-forge/linux-64/python-3.11.4-h2755cc3_0.conda", "9e1f"),
+]
+
+
+def make_environments():
+    yield Environment(name="minimal")
+    yield Environment(
+        name="full",
+        channels=["conda-forge", "defaults"],
+        dependencies=["pip=23.2=pyhd8ed1ab_0", "python=3.11.4", {"pip": ["six==1.16.0", "mypkg @ file:///home/user/some long path/with spaces/" + "mypkg-1.0.tar.gz" * 4]}],
+        prefix="/opt/envs/full",
+        variables={"B_VAR": "b", "A_VAR": "a: quoted"},
+        subdir="linux-64",
+        requested=["python=3.11", "pip"],
+        explicit=[f"{url}#{md5}" for url, md5 in EXPLICIT],
+    )
+    yield Environment(
+        name="lazy",
+        channels=["conda-forge"],
+        dependencies=["python=3.11.4"],
+        prefix="/opt/envs/lazy",
+        subdir="linux-64",
+        requested=_LazyRecords(("python=3.11", "pip"), str),
+        explicit=_LazyRecords(EXPLICIT, lambda rec: f"{rec[0]}#{rec[1]}"),
+    )
+    yield Environment(
+        name="base-only",
+        dependencies=["python"],
+        subdir="linux-64",
+        requested=_LazyRecords(("python",), str),
+        only_base_fields=True,
+    )
+
+
+ENVIRONMENTS = list(make_environments())
+
+
+@pytest.mark.parametrize("env", ENVIRONMENTS, ids=lambda env: env.name)
+def test_to_dict_materializes_lazy_records(env):
+    d = env.to_dict()
+    for key in ("requested", "explicit"):
+        if key in d:
+            assert isinstance(d[key], list)
+
+
+def test_lazy_records_sequence():
+    records = _LazyRecords((1, 2), str)
+    assert records
+    assert not _LazyRecords((), str)
+    assert len(records) == 2
+    assert list(records) == list(records) == ["1", "2"]
+    assert records == ["1", "2"]
+    assert records != ["1"]
+    assert records[1] == "2"
+    assert records[:1] == ["1"]
+    assert records + ["3"] == ["1", "2", "3"]
+    assert ["0"] + records == ["0", "1", "2"]
+    assert repr(records) == "['1', '2']"
+
+
+class RecordingStream(StringIO):
+    def __init__(self, log):
+        super().__init__()
+        self.log = log
+
+    def write(self, text):
+        self.log.append("write")
+        return super().write(text)
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda env, stream: env.to_yaml(stream=stream),
+        lambda env, stream: env.to_dict(stream=stream),
+        lambda env, stream: env.to_json(stream),
+    ],
+    ids=["yaml", "dict", "json"],
+)
+def test_lazy_records_written_item_by_item(write):
+    log = []
+
+    def fmt(record):
+        log.append("fmt")
+        return record
+
+    records = [f"https://example.com/pkg-{i}.conda#{i}" for i in range(5)]
+    env = Environment(name="lazy", explicit=_LazyRecords(records, fmt), subdir="linux-64")
+    stream = RecordingStream(log)
+    write(env, stream)
+    assert log.count("fmt") == len(records)
+    fmt_positions = [i for i, entry in enumerate(log) if entry == "fmt"]
+    for previous, current in zip(fmt_positions, fmt_positions[1:]):
+        assert "write" in log[previous:current]
+    assert all(record in stream.getvalue() for record in records)
+
+
+@pytest.mark.parametrize("env", ENVIRONMENTS, ids=lambda env: env.name)
+def test_to_dict_stream_matches_json_dumps(env):
+    stream = StringIO()
+    env.to_dict(stream=stream)
+    assert stream.getvalue() == json.dumps(env.to_dict())
+
+
+@pytest.mark.parametrize("env", ENVIRONMENTS, ids=lambda env: env.name)
+def test_to_json_matches_stdout_json_format(env):
+    # stdout_json printed json_dump(d) (indent=2, sorted keys) plus a newline
+    stream = StringIO()
+    env.to_json(stream)
+    assert stream.getvalue() == json.dumps(env.to_dict(), indent=2, sort_keys=True) + "\n"
+
+
+@pytest.mark.parametrize("env", ENVIRONMENTS, ids=lambda env: env.name)
+def test_to_yaml_stream_matches_single_dump(env):
+    expected = yaml_safe_dump(env.to_dict())
+    assert env.to_yaml() == expected
+    stream = StringIO()
+    env.to_yaml(stream=stream)
+    assert stream.getvalue() == expected
+
+
+@pytest.mark.parametrize("env", ENVIRONMENTS, ids=lambda env: env.name)
+def test_to_yaml_binary_stream_matches_single_dump(env):
+    expected = BytesIO()
+    yaml_safe_dump(env.to_dict(), expected)
+    stream = BytesIO()
+    env.to_yaml(stream=stream)
+    assert stream.getvalue() == expected.getvalue()